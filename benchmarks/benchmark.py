@@ -0,0 +1,785 @@
+#!/usr/bin/env python3
+"""Lectern vs Composer benchmark suite.
+
+Runs the same commands through Lectern and Composer against the test
+projects in benchmarks/projects/, then writes a Markdown report with
+comparison charts. Complements bench.sh (hyperfine) with a richer
+multi-project matrix and visual output.
+
+Usage:
+    python3 benchmarks/benchmark.py [--no-charts]
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
+from pathlib import Path
+
+# Chart fills pre-mixed against white rather than alpha-blended at draw
+# time: flat opaque colors keep the rendered PNGs free of per-pixel
+# alpha so they quantize cleanly to a small palette.
+LECTERN_GREEN = "#33D374"
+COMPOSER_RED = "#FF6969"
+TIER_ORANGE = "#FFA033"
+
+_MPL = None
+
+
+def _lazy_mpl():
+    """Import matplotlib/numpy on first use, caching the modules.
+
+    Importing matplotlib costs hundreds of ms (font cache, backend
+    selection); a --no-charts run should not pay it.
+    """
+    global _MPL
+    if _MPL is None:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as mpatches
+        import numpy as np
+        plt.style.use("default")
+        plt.rcParams["savefig.bbox"] = "standard"
+        _MPL = (plt, mpatches, np)
+    return _MPL
+
+
+class BenchmarkResult:
+    """Outcome of one Lectern-vs-Composer command comparison.
+
+    improvement and status are fixed once the timings are known, so they
+    are computed once here instead of on every attribute access during
+    report generation; __slots__ keeps the per-result footprint small.
+    """
+
+    __slots__ = ("command", "lectern_time", "composer_time",
+                 "lectern_success", "composer_success", "notes",
+                 "improvement", "status")
+
+    def __init__(self, command, lectern_time, composer_time,
+                 lectern_success, composer_success, notes=""):
+        self.command = command
+        self.lectern_time = lectern_time
+        self.composer_time = composer_time
+        self.lectern_success = lectern_success
+        self.composer_success = composer_success
+        self.notes = notes
+        # How many times faster Lectern is than Composer (0.0 if unknown).
+        if lectern_time > 0 and composer_time > 0:
+            self.improvement = composer_time / lectern_time
+        else:
+            self.improvement = 0.0
+        self.status = self._compute_status()
+
+    def _compute_status(self):
+        if self.lectern_success and self.composer_success:
+            return "✅ Both"
+        if self.lectern_success:
+            return "⚠️ Lectern only"
+        if self.composer_success:
+            return "⚠️ Composer only"
+        return "❌ Both failed"
+
+
+class LecternBenchmark:
+    """Drives the benchmark matrix and produces the report."""
+
+    def __init__(self, project_root, warmup_runs=1, timing_runs=3):
+        self.project_root = project_root
+        self.lectern_binary = project_root / "target" / "release" / "lectern"
+        self.benchmarks_dir = project_root / "benchmarks"
+        self.projects_dir = self.benchmarks_dir / "projects"
+        self.charts_dir = self.benchmarks_dir / "charts"
+        self.report_path = self.benchmarks_dir / "BENCHMARK_REPORT.md"
+        self.timings_path = self.benchmarks_dir / ".last_timings.json"
+        self.warmup_runs = warmup_runs
+        self.timing_runs = timing_runs
+        self.results = []
+        self._results_lock = threading.Lock()
+        self._warmed_projects = set()
+        self._warmup_lock = threading.Lock()
+
+    def run_command(self, cmd, cwd, timeout=120, capture=False):
+        """Run a command and return (elapsed_seconds, success, output).
+
+        Uses time.perf_counter() — the monotonic high-resolution clock —
+        so short commands are not at the mercy of NTP adjustments or the
+        coarse system-clock resolution on some platforms.
+
+        Output goes to /dev/null by default: draining and decoding pipes
+        for commands that print a lot (Composer install emits megabytes
+        of progress text) would otherwise be billed to the measured
+        wall-clock. When a command fails it is re-run once with capture
+        enabled so diagnostics are still available.
+        """
+        start_time = time.perf_counter()
+        try:
+            if capture:
+                result = subprocess.run(
+                    cmd, cwd=cwd, capture_output=True, text=True, timeout=timeout
+                )
+                output = result.stdout + result.stderr
+            else:
+                result = subprocess.run(
+                    cmd, cwd=cwd, stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL, timeout=timeout
+                )
+                output = ""
+            end_time = time.perf_counter()
+            if result.returncode != 0 and not capture:
+                _, _, output = self.run_command(cmd, cwd, timeout, capture=True)
+                tail = "\n".join(output.strip().splitlines()[-10:])
+                print(f"  ⚠️  `{' '.join(map(str, cmd))}` "
+                      f"exited {result.returncode}:\n{tail}")
+            return end_time - start_time, result.returncode == 0, output
+        except subprocess.TimeoutExpired:
+            end_time = time.perf_counter()
+            return end_time - start_time, False, "Command timed out"
+        except Exception as e:
+            end_time = time.perf_counter()
+            return end_time - start_time, False, str(e)
+
+    def measure(self, cmd, cwd, runs=1):
+        """Time a command `runs` times and keep the fastest run.
+
+        Taking the minimum rather than the mean discards scheduler and
+        cache noise, the same reduction hyperfine applies.
+        """
+        best_time = None
+        success = False
+        output = ""
+        for _ in range(max(1, runs)):
+            elapsed, success, output = self.run_command(cmd, cwd)
+            if best_time is None or elapsed < best_time:
+                best_time = elapsed
+        return best_time, success, output
+
+    def warmup_project(self, test_dir):
+        """Run each binary once (untimed) so the first measured run does
+        not pay the cold-start cost of paging in the executables."""
+        if self.warmup_runs <= 0:
+            return
+        with self._warmup_lock:
+            if test_dir in self._warmed_projects:
+                return
+            self._warmed_projects.add(test_dir)
+        for _ in range(self.warmup_runs):
+            subprocess.run([str(self.lectern_binary), "--version"],
+                           cwd=test_dir, capture_output=True)
+            subprocess.run(["composer", "--version"],
+                           cwd=test_dir, capture_output=True)
+
+    def backup_project_files(self, test_dir):
+        """Snapshot composer.json/composer.lock before a mutating command."""
+        backups = {}
+        for file_name in ("composer.json", "composer.lock"):
+            file_path = test_dir / file_name
+            if file_path.exists():
+                # Raw bytes: no UTF-8 decode/encode round-trip and no
+                # newline translation between backup and restore.
+                backups[file_name] = file_path.read_bytes()
+        return backups
+
+    def restore_project_files(self, test_dir, backups):
+        """Put composer.json/composer.lock back the way backup found them."""
+        for file_name in ("composer.json", "composer.lock"):
+            file_path = test_dir / file_name
+            if file_name in backups:
+                content = backups[file_name]
+                if file_path.exists() and file_path.read_bytes() == content:
+                    continue
+                tmp_path = file_path.with_name(file_path.name + ".restore")
+                tmp_path.write_bytes(content)
+                os.replace(tmp_path, file_path)
+            else:
+                # File was created by the command under test; remove it.
+                file_path.unlink(missing_ok=True)
+
+    def test_command(self, command_name, lectern_cmd, composer_cmd,
+                     test_project, notes="", use_backup=False,
+                     read_only=False):
+        """Time one command under Lectern and under Composer.
+
+        read_only commands run through the concurrent path. use_backup
+        is a separate concern: a command like dump-autoload rewrites
+        vendor/ files (so the two tools must not run side by side) yet
+        needs no composer.json/composer.lock backup.
+        """
+        test_dir = self.projects_dir / test_project
+        if not test_dir.is_dir():
+            print(f"  ⚠️  Skipping {command_name}: missing project {test_project}")
+            return
+
+        print(f"  ⏱️  {command_name} ({test_project})")
+
+        self.warmup_project(test_dir)
+
+        if read_only:
+            # Read-only commands don't touch the project, so the two
+            # tools can run side by side and be timed independently.
+            self.test_command_parallel(command_name, lectern_cmd,
+                                       composer_cmd, test_dir, notes)
+            return
+
+        # Backed-up commands are measured once so every run starts from
+        # the backed-up state; other sequential commands take best-of-N.
+        runs = 1 if use_backup else self.timing_runs
+
+        backups = self.backup_project_files(test_dir) if use_backup else None
+
+        lectern_time, lectern_success, _ = self.measure(
+            [str(self.lectern_binary)] + lectern_cmd, test_dir, runs
+        )
+        if use_backup:
+            self.restore_project_files(test_dir, backups)
+
+        composer_time, composer_success, _ = self.measure(
+            ["composer"] + composer_cmd, test_dir, runs
+        )
+        if use_backup:
+            self.restore_project_files(test_dir, backups)
+
+        with self._results_lock:
+            self.results.append(BenchmarkResult(
+                command_name, lectern_time, composer_time,
+                lectern_success, composer_success, notes,
+            ))
+
+    def test_command_parallel(self, command_name, lectern_cmd, composer_cmd,
+                              test_dir, notes="", timeout=120):
+        """Time Lectern and Composer running concurrently.
+
+        Only safe for read-only commands, since both processes share the
+        project directory. Each process is timed from its own launch to
+        its own exit with a blocking wait — no polling loop. Lectern is
+        waited on first; it is consistently the faster of the two, so
+        Composer is still running when its wait begins.
+
+        Failure handling mirrors run_command: a process that cannot be
+        launched or that outlives the timeout (it is killed) is recorded
+        as a failed result rather than hanging the group's worker or
+        letting the exception escape into future.result().
+        """
+        def launch(cmd):
+            start = time.perf_counter()
+            try:
+                proc = subprocess.Popen(
+                    cmd, cwd=test_dir,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                )
+            except Exception as e:
+                print(f"  ⚠️  failed to launch `{' '.join(map(str, cmd))}`: {e}")
+                proc = None
+            return start, proc
+
+        def finish(start, proc):
+            if proc is None:
+                return time.perf_counter() - start, False
+            remaining = max(0.0, timeout - (time.perf_counter() - start))
+            try:
+                proc.wait(timeout=remaining)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                return time.perf_counter() - start, False
+            return time.perf_counter() - start, proc.returncode == 0
+
+        best_lectern = best_composer = None
+        lectern_success = composer_success = False
+        for _ in range(max(1, self.timing_runs)):
+            start_l, proc_l = launch([str(self.lectern_binary)] + lectern_cmd)
+            start_c, proc_c = launch(["composer"] + composer_cmd)
+            elapsed_l, lectern_success = finish(start_l, proc_l)
+            elapsed_c, composer_success = finish(start_c, proc_c)
+
+            if best_lectern is None or elapsed_l < best_lectern:
+                best_lectern = elapsed_l
+            if best_composer is None or elapsed_c < best_composer:
+                best_composer = elapsed_c
+
+        with self._results_lock:
+            self.results.append(BenchmarkResult(
+                command_name, best_lectern, best_composer,
+                lectern_success, composer_success, notes,
+            ))
+
+    def run_all_tests(self):
+        """Run the full benchmark matrix across the test projects."""
+        print("🚀 Running Lectern vs Composer benchmarks...")
+
+        # (command_name, lectern_cmd, composer_cmd, test_project, notes,
+        #  use_backup, read_only)
+        tests = [
+            ("Install", ["--quiet", "install"], ["install", "--quiet", "--no-interaction"],
+             "simple-test", "Fresh dependency installation", True, False),
+            ("Update", ["--quiet", "update"], ["update", "--quiet", "--no-interaction"],
+             "simple-test", "Update to latest allowed versions", True, False),
+            ("Require", ["--quiet", "require", "symfony/yaml:^6.0"],
+             ["require", "symfony/yaml:^6.0", "--quiet", "--no-interaction"],
+             "simple-test", "Add a new package", True, False),
+            ("Remove", ["--quiet", "remove", "monolog/monolog"],
+             ["remove", "monolog/monolog", "--quiet", "--no-interaction"],
+             "simple-test", "Remove a package", True, False),
+            ("Search", ["--quiet", "search", "monolog"], ["search", "monolog", "--quiet"],
+             "simple-test", "Search Packagist", False, True),
+            ("Show", ["--quiet", "show", "monolog/monolog"],
+             ["show", "monolog/monolog", "--quiet"],
+             "simple-test", "Show package details", False, True),
+            ("Outdated", ["--quiet", "outdated"], ["outdated", "--quiet"],
+             "simple-test", "Check for outdated packages", False, True),
+            ("Licenses", ["--quiet", "licenses"], ["licenses", "--quiet"],
+             "simple-test", "List dependency licenses", False, True),
+            ("Status", ["--quiet", "status"], ["show", "--quiet"],
+             "simple-test", "Show installed packages", False, True),
+            ("Validate", ["--quiet", "validate"], ["validate", "--quiet"],
+             "simple-test", "Validate composer.json", False, True),
+            ("Dump Autoload", ["--quiet", "dump-autoload"], ["dump-autoload", "--quiet"],
+             "simple-test", "Regenerate the autoloader", False, False),
+            ("Install (laravel)", ["--quiet", "install"], ["install", "--quiet", "--no-interaction"],
+             "simple-laravel", "Install a Laravel skeleton", True, False),
+            ("Status (laravel)", ["--quiet", "status"], ["show", "--quiet"],
+             "simple-laravel", "Status on a Laravel skeleton", False, True),
+            ("Install (symfony)", ["--quiet", "install"], ["install", "--quiet", "--no-interaction"],
+             "symfony-app", "Install a Symfony app", True, False),
+            ("Update (symfony)", ["--quiet", "update"], ["update", "--quiet", "--no-interaction"],
+             "symfony-app", "Update a Symfony app", True, False),
+            ("Status (symfony)", ["--quiet", "status"], ["show", "--quiet"],
+             "symfony-app", "Status on a Symfony app", False, True),
+            ("Install (complex)", ["--quiet", "install"], ["install", "--quiet", "--no-interaction"],
+             "complex-app", "Install a large dependency tree", True, False),
+            ("Update (complex)", ["--quiet", "update"], ["update", "--quiet", "--no-interaction"],
+             "complex-app", "Update a large dependency tree", True, False),
+            ("Status (complex)", ["--quiet", "status"], ["show", "--quiet"],
+             "complex-app", "Status on a large dependency tree", False, True),
+        ]
+
+        # Each test project is an independent directory with its own
+        # backups, so groups keyed to different projects can run on
+        # separate cores. Tests that mutate the same project stay serial
+        # within their group, and the Lectern-vs-Composer ordering inside
+        # test_command stays sequential to keep the comparison fair.
+        groups = {}
+        for test in tests:
+            groups.setdefault(test[3], []).append(test)
+
+        # Profile-guided scheduling: with timings from the previous run,
+        # each group's read-only tests run shortest-first, so short
+        # results land early even if a later command hangs against its
+        # timeout. The mutating block keeps its fixed order and stays in
+        # front — Install must run before the read-only commands have a
+        # vendor/ and composer.lock to inspect (both are gitignored, so
+        # a fresh checkout starts uninstalled).
+        last_timings = self._load_last_timings()
+        for project, group in groups.items():
+            read_only = sorted(
+                (t for t in group if t[6]),
+                key=lambda t: last_timings.get(t[0], float("inf")),
+            )
+            mutating = [t for t in group if not t[6]]
+            groups[project] = mutating + read_only
+
+        def run_group(group_tests):
+            for (command_name, lectern_cmd, composer_cmd, test_project,
+                 notes, use_backup, read_only) in group_tests:
+                self.test_command(command_name, lectern_cmd, composer_cmd,
+                                  test_project, notes, use_backup,
+                                  read_only)
+
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [executor.submit(run_group, group)
+                       for group in groups.values()]
+            for future in as_completed(futures):
+                future.result()
+
+        print(f"✅ Completed {len(self.results)} benchmarks")
+
+    def write_report(self, fh, chart_files=None):
+        """Stream the Markdown report into an open file handle.
+
+        Rows and bullets are written as they are produced, so the full
+        report never has to exist as one in-memory string no matter how
+        large the benchmark matrix gets.
+        """
+        def write_bullets(lines):
+            wrote = False
+            for line in lines:
+                fh.write(line)
+                wrote = True
+            if not wrote:
+                fh.write("*(none)*\n")
+
+        positive = [r.improvement for r in self.results if r.improvement > 0]
+        avg_improvement = statistics.fmean(positive) if positive else 0.0
+        max_improvement = max(positive) if positive else 0.0
+
+        fh.write(
+            "# Lectern vs Composer Benchmark Report\n\n"
+            f"> Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            f"Lectern ran **{avg_improvement:.1f}x faster** than Composer on average\n"
+            f"across {len(self.results)} benchmarks (best case: {max_improvement:.1f}x).\n\n"
+            "## Results\n\n"
+            "| Command | Lectern | Composer | Speedup | Status | Notes |\n"
+            "|---------|---------|----------|---------|--------|-------|\n"
+        )
+        for r in self.results:
+            speedup = f"{r.improvement:.1f}x" if r.improvement > 0 else "n/a"
+            fh.write(
+                f"| {r.command} | {r.lectern_time:.3f}s | {r.composer_time:.3f}s "
+                f"| {speedup} | {r.status} | {r.notes} |\n"
+            )
+
+        fh.write("\n## Highlights\n\n### Ultra fast (≥10x)\n\n")
+        write_bullets(
+            f"- **{r.command}**: {r.improvement:.1f}x faster\n"
+            for r in self.results if r.improvement >= 10
+        )
+        fh.write("\n### Fast (2-10x)\n\n")
+        write_bullets(
+            f"- **{r.command}**: {r.improvement:.1f}x faster\n"
+            for r in self.results if 2 <= r.improvement < 10
+        )
+        fh.write("\n### Comparable (0.5-2x)\n\n")
+        write_bullets(
+            f"- **{r.command}**: {r.improvement:.1f}x\n"
+            for r in self.results if 0.5 <= r.improvement < 2
+        )
+
+        core_commands = ["Install", "Update", "Require", "Remove"]
+        by_name = {r.command: r for r in self.results}
+        fh.write("\n## Core Commands\n\n")
+        write_bullets(
+            f"- **{result.command}**: Lectern {result.lectern_time:.3f}s vs "
+            f"Composer {result.composer_time:.3f}s "
+            f"({result.improvement:.1f}x faster)\n"
+            for result in (by_name.get(name) for name in core_commands)
+            if result is not None
+        )
+        fh.write("\n")
+
+        if chart_files:
+            fh.write("## Performance Charts\n\n")
+            for chart_file in chart_files:
+                title = chart_file.replace("_", " ").replace(".png", "").title()
+                fh.write(f"### {title}\n\n![{title}](charts/{chart_file})\n\n")
+
+        failures = [r for r in self.results
+                    if not (r.lectern_success and r.composer_success)]
+        if failures:
+            fh.write("## Issues\n\n")
+            for r in failures:
+                fh.write(f"- **{r.command}**: {r.status}\n")
+            fh.write("\n")
+
+        fh.write(
+            "---\n\n"
+            "*Benchmarks run against the projects in `benchmarks/projects/`. Mutating\n"
+            "commands (install/update/require/remove) restore composer.json and\n"
+            "composer.lock between runs so both tools see the same starting state.*\n"
+        )
+
+    def save_report(self, chart_files=None):
+        with open(self.report_path, "w", buffering=1 << 20) as fh:
+            self.write_report(fh, chart_files)
+        self._save_last_timings()
+        print(f"📄 Report saved to {self.report_path}")
+
+    def _load_last_timings(self):
+        """Per-command Lectern timings from the previous run, if any."""
+        try:
+            return json.loads(self.timings_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_last_timings(self):
+        timings = {r.command: r.lectern_time for r in self.results}
+        self.timings_path.write_text(json.dumps(timings, indent=2))
+
+    def generate_performance_charts(self):
+        """Generate the comparison charts; returns the PNG file names."""
+        successful_results = [r for r in self.results
+                              if r.lectern_success and r.composer_success]
+        if not successful_results:
+            return []
+
+        self.charts_dir.mkdir(parents=True, exist_ok=True)
+
+        # Plain lists so the payload pickles cheaply into the workers.
+        # The four renderers are independent and CPU-bound (Agg render
+        # plus PNG encode), so each runs in its own process and the
+        # matplotlib import is paid per worker rather than serially.
+        improvements = [r.improvement for r in successful_results]
+        chart_data = {
+            "commands": [r.command for r in successful_results],
+            "lectern": [r.lectern_time for r in successful_results],
+            "composer": [r.composer_time for r in successful_results],
+            "improvements": improvements,
+            "colors": [LECTERN_GREEN if imp >= 10
+                       else TIER_ORANGE if imp >= 2
+                       else COMPOSER_RED
+                       for imp in improvements],
+        }
+
+        renderers = (_render_comparison_chart, _render_scatter_chart,
+                     _render_distribution_chart, _render_category_chart)
+        with ProcessPoolExecutor(max_workers=len(renderers)) as executor:
+            futures = [executor.submit(fn, chart_data, str(self.charts_dir))
+                       for fn in renderers]
+            chart_files = [future.result() for future in futures]
+        print(f"📊 Charts saved to {self.charts_dir}")
+        return chart_files
+
+
+def _save_chart_file(fig, chart_path):
+    """Render the figure once into memory and write the PNG whole.
+
+    Rendering into a BytesIO and emitting the bytes with a single
+    write_bytes keeps the Agg render pass and the disk write separate —
+    there is no second layout/render at save time and no incremental
+    writes through a buffered Python file object.
+
+    The charts use a handful of flat colors, so when Pillow is available
+    the 32-bit RGBA render is re-encoded as an indexed (palette) PNG —
+    noticeably smaller with no visible difference in Markdown. Without
+    Pillow the raw PNG is written as-is.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, dpi=150, format="png", facecolor="white")
+    try:
+        from PIL import Image
+    except ImportError:
+        chart_path.write_bytes(buf.getvalue())
+    else:
+        buf.seek(0)
+        img = Image.open(buf).convert("RGB")
+        img = img.convert("P", palette=Image.ADAPTIVE, colors=64)
+        img.save(chart_path, optimize=True)
+    return chart_path.name
+
+
+def _render_comparison_chart(chart_data, output_dir):
+    """Grouped per-command bars of Lectern vs Composer times."""
+    plt, _mpatches, np = _lazy_mpl()
+    fig = plt.figure(figsize=(14, 8))
+    ax = fig.add_subplot(111)
+    x = np.arange(len(chart_data["commands"]))
+    width = 0.35
+
+    bars1 = ax.bar(x - width / 2, chart_data["lectern"], width,
+                   label="Lectern", color=LECTERN_GREEN)
+    bars2 = ax.bar(x + width / 2, chart_data["composer"], width,
+                   label="Composer", color=COMPOSER_RED)
+
+    ax.bar_label(bars1, fmt="%.3fs", fontsize=8, padding=2)
+    ax.bar_label(bars2, fmt="%.3fs", fontsize=8, padding=2)
+
+    ax.set_xlabel("Command")
+    ax.set_ylabel("Time (seconds, log scale)")
+    ax.set_title("Lectern vs Composer Execution Time")
+    ax.set_xticks(x)
+    ax.set_xticklabels(chart_data["commands"], rotation=45, ha="right")
+    ax.set_yscale("log")
+    ax.legend()
+    ax.grid(axis="y", alpha=0.3)
+
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.94, bottom=0.24)
+    name = _save_chart_file(fig, Path(output_dir) / "performance_comparison.png")
+    plt.close(fig)
+    return name
+
+
+def _render_scatter_chart(chart_data, output_dir):
+    """Scatter of Composer time vs Lectern time per command.
+
+    The points are deliberately unlabeled: the chart shows the shape of
+    the comparison (distance below the equal-time diagonal), per-command
+    numbers live in the report table, and a speedup-tier legend explains
+    the point colors. Per-point annotations would add a Text artist per
+    command and slow the layout pass for no extra information.
+    """
+    plt, mpatches, _np = _lazy_mpl()
+    lectern_times = chart_data["lectern"]
+    composer_times = chart_data["composer"]
+
+    fig = plt.figure(figsize=(10, 10))
+    ax = fig.add_subplot(111)
+    ax.scatter(composer_times, lectern_times, s=80,
+               c=chart_data["colors"], zorder=3)
+
+    limit = max(max(composer_times), max(lectern_times)) * 1.2
+    equal_line, = ax.plot([0, limit], [0, limit], "--", color="gray",
+                          alpha=0.6, label="Equal time")
+
+    ax.set_xlabel("Composer time (s)")
+    ax.set_ylabel("Lectern time (s)")
+    ax.set_title("Execution Time: Lectern vs Composer")
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.legend(handles=[
+        equal_line,
+        mpatches.Patch(color=LECTERN_GREEN, label="≥10x faster"),
+        mpatches.Patch(color=TIER_ORANGE, label="2-10x faster"),
+        mpatches.Patch(color=COMPOSER_RED, label="<2x"),
+    ])
+    ax.grid(alpha=0.3)
+
+    fig.subplots_adjust(left=0.1, right=0.97, top=0.95, bottom=0.08)
+    name = _save_chart_file(fig, Path(output_dir) / "execution_time_scatter.png")
+    plt.close(fig)
+    return name
+
+
+def _render_distribution_chart(chart_data, output_dir):
+    """Histogram of the per-command speedups."""
+    plt, _mpatches, _np = _lazy_mpl()
+    improvements = chart_data["improvements"]
+
+    fig = plt.figure(figsize=(12, 7))
+    ax = fig.add_subplot(111)
+    ax.hist(improvements, bins=20, color=LECTERN_GREEN, edgecolor="black")
+
+    mean_improvement = statistics.fmean(improvements)
+    ax.axvline(mean_improvement, color=COMPOSER_RED, linestyle="--",
+               linewidth=2, label=f"Mean: {mean_improvement:.1f}x")
+
+    ax.set_xlabel("Speedup (Composer time / Lectern time)")
+    ax.set_ylabel("Number of commands")
+    ax.set_title("Distribution of Lectern Speedups")
+    ax.legend()
+    ax.grid(axis="y", alpha=0.3)
+
+    fig.subplots_adjust(left=0.08, right=0.97, top=0.94, bottom=0.1)
+    name = _save_chart_file(fig, Path(output_dir) / "improvement_distribution.png")
+    plt.close(fig)
+    return name
+
+
+def _render_category_chart(chart_data, output_dir):
+    """Average Lectern vs Composer times per command category."""
+    plt, mpatches, np = _lazy_mpl()
+    categories = {
+        "Core": ["Install", "Update", "Require", "Remove"],
+        "Analysis": ["Outdated", "Licenses", "Status", "Validate"],
+        "Discovery": ["Search", "Show"],
+        "Autoload": ["Dump Autoload"],
+    }
+
+    times_by_name = dict(zip(chart_data["commands"],
+                             zip(chart_data["lectern"], chart_data["composer"])))
+    category_names = []
+    lectern_avgs = []
+    composer_avgs = []
+    for category, command_names in categories.items():
+        lectern_times = []
+        composer_times = []
+        for name in command_names:
+            times = times_by_name.get(name)
+            if times is not None:
+                lectern_times.append(times[0])
+                composer_times.append(times[1])
+        if lectern_times:
+            category_names.append(category)
+            lectern_avgs.append(sum(lectern_times) / len(lectern_times))
+            composer_avgs.append(sum(composer_times) / len(composer_times))
+
+    fig = plt.figure(figsize=(10, 7))
+    ax = fig.add_subplot(111)
+    x = np.arange(len(category_names))
+    width = 0.35
+
+    bars1 = ax.bar(x - width / 2, lectern_avgs, width, color=LECTERN_GREEN)
+    bars3 = ax.bar(x + width / 2, composer_avgs, width, color=COMPOSER_RED)
+
+    ax.bar_label(bars1, fmt="%.3fs", fontsize=8, padding=2)
+    ax.bar_label(bars3, fmt="%.3fs", fontsize=8, padding=2)
+
+    ax.set_xlabel("Category")
+    ax.set_ylabel("Average time (seconds, log scale)")
+    ax.set_title("Average Time by Command Category")
+    ax.set_xticks(x)
+    ax.set_xticklabels(category_names)
+    ax.set_yscale("log")
+    ax.legend(handles=[
+        mpatches.Patch(color=LECTERN_GREEN, label="Lectern"),
+        mpatches.Patch(color=COMPOSER_RED, label="Composer"),
+    ])
+    ax.grid(axis="y", alpha=0.3)
+
+    fig.subplots_adjust(left=0.09, right=0.97, top=0.94, bottom=0.1)
+    name = _save_chart_file(fig, Path(output_dir) / "category_performance.png")
+    plt.close(fig)
+    return name
+
+
+def _find_project_root():
+    """Locate the directory holding Cargo.toml, or None.
+
+    The answer is cached in LECTERN_PROJECT_ROOT so repeated runs from
+    the same shell skip the parent-directory scan.
+    """
+    cached = os.environ.get("LECTERN_PROJECT_ROOT")
+    if cached and (Path(cached) / "Cargo.toml").is_file():
+        return Path(cached)
+    root = next(
+        (p for p in [Path.cwd(), *Path.cwd().parents]
+         if (p / "Cargo.toml").is_file()),
+        None,
+    )
+    if root is not None:
+        os.environ["LECTERN_PROJECT_ROOT"] = str(root)
+    return root
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark Lectern against Composer")
+    parser.add_argument("--no-charts", action="store_true",
+                        help="skip chart generation")
+    parser.add_argument("--skip-build", action="store_true",
+                        help="do not rebuild Lectern first")
+    args = parser.parse_args()
+
+    project_root = _find_project_root()
+    if project_root is None:
+        print("❌ Could not find the project root (no Cargo.toml)")
+        sys.exit(1)
+
+    if not args.skip_build:
+        print("🔨 Building Lectern in release mode...")
+        build = subprocess.run(["cargo", "build", "--release", "--quiet"],
+                               cwd=project_root)
+        if build.returncode != 0:
+            print("❌ cargo build failed")
+            sys.exit(1)
+
+    benchmark = LecternBenchmark(project_root)
+    if not benchmark.lectern_binary.exists():
+        print(f"❌ Lectern binary not found at {benchmark.lectern_binary}")
+        sys.exit(1)
+
+    benchmark.run_all_tests()
+
+    chart_files = None
+    if not args.no_charts:
+        # Never let a chart problem (matplotlib missing, a renderer
+        # crashing in its worker) throw away the collected timings —
+        # fall back to a chart-less report.
+        try:
+            chart_files = benchmark.generate_performance_charts()
+        except Exception as e:
+            print(f"⚠️  Chart generation failed ({e}); "
+                  "writing the report without charts")
+            chart_files = None
+
+    benchmark.save_report(chart_files)
+
+
+if __name__ == "__main__":
+    main()